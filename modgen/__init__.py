@@ -1,36 +1,62 @@
-"""Public exports for the Modgen package."""
-
-from .exceptions import (
-    InvalidProjectNameError,
-    ProjectError,
-    ProjectExistsError,
-    ProjectNotFoundError,
-    ProjectNotInitializedError,
-    ProjectSerializationError,
-)
-from .openai_client import OpenAIAPIError, OpenAIClient
-from .project_manager import Project, ProjectManager
-from .prompt import PromptMessage, StructuredPrompt
-from .response import Choice, OpenAIResponse, Usage
-from .validation_engine import ValidationEngine, ValidationIssue, ValidationResult
-
-__all__ = [
-    "Choice",
-    "InvalidProjectNameError",
-    "OpenAIAPIError",
-    "OpenAIClient",
-    "OpenAIResponse",
-    "Project",
-    "ProjectError",
-    "ProjectExistsError",
-    "ProjectManager",
-    "ProjectNotFoundError",
-    "ProjectNotInitializedError",
-    "ProjectSerializationError",
-    "PromptMessage",
-    "StructuredPrompt",
-    "Usage",
-    "ValidationEngine",
-    "ValidationIssue",
-    "ValidationResult",
-]
+"""Public exports for the Modgen package.
+
+Submodules are imported on first attribute access (PEP 562), so ``import
+modgen`` stays cheap and only the parts of the package that are used get
+loaded.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_openai_client import AsyncOpenAIClient
+    from .exceptions import (
+        InvalidProjectNameError,
+        ProjectError,
+        ProjectExistsError,
+        ProjectNotFoundError,
+        ProjectNotInitializedError,
+        ProjectSerializationError,
+    )
+    from .openai_client import OpenAIAPIError, OpenAIClient
+    from .project_manager import Project, ProjectManager
+    from .prompt import PromptMessage, StructuredPrompt
+    from .response import Choice, OpenAIResponse, Usage
+    from .validation_engine import ValidationEngine, ValidationIssue, ValidationResult
+
+_LAZY_ATTRIBUTES = {
+    "AsyncOpenAIClient": "async_openai_client",
+    "Choice": "response",
+    "InvalidProjectNameError": "exceptions",
+    "OpenAIAPIError": "openai_client",
+    "OpenAIClient": "openai_client",
+    "OpenAIResponse": "response",
+    "Project": "project_manager",
+    "ProjectError": "exceptions",
+    "ProjectExistsError": "exceptions",
+    "ProjectManager": "project_manager",
+    "ProjectNotFoundError": "exceptions",
+    "ProjectNotInitializedError": "exceptions",
+    "ProjectSerializationError": "exceptions",
+    "PromptMessage": "prompt",
+    "StructuredPrompt": "prompt",
+    "Usage": "response",
+    "ValidationEngine": "validation_engine",
+    "ValidationIssue": "validation_engine",
+    "ValidationResult": "validation_engine",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
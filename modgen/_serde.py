@@ -0,0 +1,199 @@
+"""Serialisation helpers shared by the Modgen modules.
+
+:mod:`orjson` is used to encode JSON when it is installed and the standard
+library :mod:`json` module otherwise. orjson only handles inputs on which it
+agrees with the standard library, so both paths produce the same UTF-8 encoded
+``bytes`` and raise the same exception types; callers do not need to know
+which backend is active. Decoding always uses the standard library, see
+:func:`loads`. MessagePack support requires :mod:`msgspec`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the installed extras
+    msgspec = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _orjson_encodes_like_json(obj: Any) -> bool:
+    """Return ``True`` if orjson would encode ``obj`` exactly like :mod:`json`.
+
+    orjson natively encodes values the standard library rejects (dataclasses,
+    datetimes, enums, UUIDs, ...) and writes non-finite floats as ``null``, so
+    only plain containers of finite scalars are handed to it.
+    """
+
+    kind = type(obj)
+    if kind is str or kind is int or kind is bool or obj is None:
+        return True
+    if kind is float:
+        return math.isfinite(obj)
+    if kind is dict:
+        for key, value in obj.items():
+            key_kind = type(key)
+            if key_kind is not str and key_kind is not int:
+                return False
+            if not _orjson_encodes_like_json(value):
+                return False
+        return True
+    if kind is list or kind is tuple:
+        return all(map(_orjson_encodes_like_json, obj))
+    return False
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode ``obj`` as JSON.
+
+    Raises:
+        TypeError: ``obj`` contains a value that cannot be encoded.
+        ValueError: ``obj`` contains a circular reference.
+    """
+
+    if orjson is not None:
+        try:
+            compatible = _orjson_encodes_like_json(obj)
+        except RecursionError:
+            # Circular or very deep structures; the standard library reports
+            # these with the documented exception.
+            compatible = False
+        if compatible:
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, option=option)
+            except TypeError:
+                # orjson rejects integers wider than 64 bits; the standard
+                # library encodes them exactly.
+                pass
+    text = json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    orjson is deliberately not used here: it silently decodes integers wider
+    than 64 bits as floats, and ruling those out (by scanning the document or
+    walking the result) costs more than it saves over the standard library.
+
+    Raises:
+        JSONDecodeError: ``data`` is not valid JSON.
+        UnicodeDecodeError: ``data`` is ``bytes`` that are not valid UTF-8.
+    """
+
+    return json.loads(data)
+
+
+if msgspec is not None:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder(dict)
+
+# MessagePack documents are framed with their length so that a truncated file
+# is detected instead of silently decoding a prefix.
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def _json_key(key: Any) -> str:
+    """Convert a mapping key the way :func:`json.dumps` does."""
+
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(float.__float__(key))
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _to_json_model(obj: Any) -> Any:
+    """Return ``obj`` reduced to the values :func:`json.dumps` would write.
+
+    Keys are converted to strings and subclasses of the builtin types to the
+    builtins themselves, so MessagePack metadata accepts and decodes to the
+    same values as JSON metadata.
+
+    Raises:
+        TypeError: ``obj`` contains a value :mod:`json` cannot encode.
+    """
+
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if obj is None or obj is True or obj is False:
+        return obj
+    if isinstance(obj, int):
+        return int.__int__(obj)
+    if isinstance(obj, float):
+        return float.__float__(obj)
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_model(item) for item in obj]
+    if isinstance(obj, dict):
+        return {_json_key(key): _to_json_model(value) for key, value in obj.items()}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_msgpack(obj: Any) -> bytes:
+    """Encode the mapping ``obj`` as a length-prefixed MessagePack frame.
+
+    ``obj`` is first reduced to the JSON data model (see
+    :func:`_to_json_model`); only integers outside the 64-bit range, which
+    JSON can store but MessagePack cannot, are rejected in addition.
+
+    Raises:
+        RuntimeError: :mod:`msgspec` is not installed.
+        TypeError: ``obj`` contains a value that cannot be encoded.
+        ValueError: ``obj`` contains a circular reference or a value outside
+            the encodable range.
+    """
+
+    if msgspec is None:
+        raise RuntimeError("msgspec is required for MessagePack serialisation")
+    try:
+        obj = _to_json_model(obj)
+    except RecursionError as exc:
+        raise ValueError("Circular reference detected") from exc
+    try:
+        body = _MSGPACK_ENCODER.encode(obj)
+    except (msgspec.EncodeError, OverflowError) as exc:
+        raise ValueError(str(exc)) from exc
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+def loads_msgpack(data: bytes) -> Any:
+    """Decode a frame produced by :func:`dumps_msgpack`.
+
+    Raises:
+        RuntimeError: :mod:`msgspec` is not installed.
+        ValueError: ``data`` is truncated or not a valid document.
+    """
+
+    if msgspec is None:
+        raise RuntimeError("msgspec is required for MessagePack serialisation")
+    header_size = _FRAME_HEADER.size
+    if len(data) < header_size:
+        raise ValueError("MessagePack frame is truncated")
+    (length,) = _FRAME_HEADER.unpack_from(data)
+    if len(data) - header_size != length:
+        raise ValueError("MessagePack frame length does not match its header")
+    return _MSGPACK_DECODER.decode(memoryview(data)[header_size:])
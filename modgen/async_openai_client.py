@@ -0,0 +1,94 @@
+"""Asynchronous OpenAI client for issuing many chat completions concurrently."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from .openai_client import OpenAIAPIError, OpenAIClient
+from .prompt import StructuredPrompt
+from .response import OpenAIResponse
+
+
+class AsyncOpenAIClient:
+    """Send structured prompts to the OpenAI API from ``asyncio`` code.
+
+    Requests run on a dedicated thread pool, each using one of up to
+    ``max_connections`` pooled :class:`OpenAIClient` instances, so awaiting
+    many completions with :func:`asyncio.gather` overlaps their round trips.
+    At most ``max_keepalive_connections`` idle connections are kept open
+    between bursts; by default every connection is kept alive.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        max_connections: int = 10,
+        max_keepalive_connections: Optional[int] = None,
+        **config_kwargs: Any,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if max_keepalive_connections is None:
+            max_keepalive_connections = max_connections
+        if max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections cannot be negative")
+        self._api_key = api_key
+        self._config_kwargs = config_kwargs
+        self._max_keepalive = max_keepalive_connections
+        self._idle: List[OpenAIClient] = []
+        self._closed = False
+        self._slots = asyncio.Semaphore(max_connections)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="modgen-openai"
+        )
+
+    async def __aenter__(self) -> "AsyncOpenAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections and shut down the worker threads.
+
+        Requests that are still running finish normally and close their
+        connection afterwards; new requests are rejected.
+        """
+
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for client in idle:
+            client.close()
+        self._executor.shutdown(wait=False)
+
+    async def create_chat_completion(self, prompt: StructuredPrompt) -> OpenAIResponse:
+        """Send the structured prompt to the chat completions endpoint."""
+
+        async with self._slots:
+            if self._closed:
+                raise OpenAIAPIError("AsyncOpenAIClient is closed")
+            client = self._idle.pop() if self._idle else self._new_client()
+            future = self._executor.submit(client.create_chat_completion, prompt)
+            try:
+                response = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # The worker thread may still be using the connection, so it
+                # is closed once the call finishes instead of being reused.
+                future.add_done_callback(lambda _: client.close())
+                raise
+            except Exception:
+                self._release(client)
+                raise
+            self._release(client)
+            return response
+
+    def _new_client(self) -> OpenAIClient:
+        return OpenAIClient(self._api_key, **self._config_kwargs)
+
+    def _release(self, client: OpenAIClient) -> None:
+        if not self._closed and len(self._idle) < self._max_keepalive:
+            self._idle.append(client)
+        else:
+            client.close()
@@ -1,14 +1,17 @@
 """OpenAI API client focused on structured prompt workflows."""
 from __future__ import annotations
 
-import json
+import base64
 import logging
+import select
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from functools import cached_property
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass
 
+from . import _serde
 from .prompt import StructuredPrompt
 from .response import OpenAIResponse
 
@@ -18,13 +21,27 @@ LOGGER = logging.getLogger(__name__)
 class OpenAIAPIError(RuntimeError):
     """Raised when the OpenAI API returns an error or malformed response."""
 
-    def __init__(self, message: str, *, status_code: Optional[int] = None, payload: Optional[str] = None):
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: Optional[int] = None,
+        payload: Optional[str | bytes] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
-        self.payload = payload
+        self._payload = payload
+
+    @property
+    def payload(self) -> Optional[str]:
+        """Return the response body or error detail, decoded on first access."""
+
+        if isinstance(self._payload, bytes):
+            self._payload = self._payload.decode("utf-8", errors="replace")
+        return self._payload
 
 
-@dataclass
+@dataclass(frozen=True)
 class OpenAIClientConfig:
     """Configuration for :class:`OpenAIClient`."""
 
@@ -35,6 +52,10 @@ class OpenAIClientConfig:
     timeout: Optional[float] = 30.0
 
     def headers(self) -> Dict[str, str]:
+        return dict(self._headers)
+
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
@@ -47,51 +68,139 @@ class OpenAIClientConfig:
 
 
 class OpenAIClient:
-    """Thin wrapper for sending structured prompts to the OpenAI API."""
+    """Thin wrapper for sending structured prompts to the OpenAI API.
+
+    Connections are kept alive and reused for every request sent to the same
+    host, so a single client instance should be shared across many
+    completions. Instances are not thread-safe; use one client per thread.
+
+    Proxies are taken from the environment (``HTTPS_PROXY``, ``HTTP_PROXY``
+    and ``NO_PROXY``) when the client is created, as :func:`urllib.request.urlopen`
+    does; HTTPS requests are tunnelled through the proxy with ``CONNECT``.
+    """
 
     def __init__(self, api_key: str, **config_kwargs: Any) -> None:
         config_kwargs.setdefault("base_url", "https://api.openai.com/v1/")
         self._config = OpenAIClientConfig(api_key=api_key, **config_kwargs)
+        self._proxies = getproxies()
+        self._connections: Dict[Tuple[str, str], HTTPConnection] = {}
+        # Extra headers for plain HTTP hosts reached through a forwarding
+        # proxy; requests to those hosts use absolute URLs as their target.
+        self._forwarded: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+    def __enter__(self) -> "OpenAIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @property
     def base_url(self) -> str:
         return self._config.base_url
 
+    def close(self) -> None:
+        """Close any pooled connections held by the client."""
+
+        connections, self._connections = self._connections, {}
+        for connection in connections.values():
+            connection.close()
+
     def _build_request(self, endpoint: str, payload: Dict[str, Any]) -> Request:
         url = urljoin(self.base_url, endpoint.lstrip("/"))
-        data = json.dumps(payload).encode("utf-8")
-        headers = self._config.headers()
+        data = _serde.dumps(payload)
+        headers = self._config._headers
         LOGGER.debug("Dispatching request to %s with headers %s", url, headers.keys())
         return Request(url=url, data=data, headers=headers, method="POST")
 
+    def _proxy_for(self, scheme: str, netloc: str) -> Optional[SplitResult]:
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(netloc):
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        return urlsplit(proxy)
+
+    def _connection_for(self, scheme: str, netloc: str) -> HTTPConnection:
+        key = (scheme, netloc)
+        connection = self._connections.get(key)
+        if connection is not None and _is_connection_dropped(connection):
+            connection.close()
+            connection = None
+        if connection is None:
+            connection_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+            proxy = self._proxy_for(scheme, netloc)
+            if proxy is None:
+                connection = connection_cls(netloc, timeout=self._config.timeout)
+            else:
+                proxy_headers = {}
+                if proxy.username is not None:
+                    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+                    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                    proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+                proxy_address = proxy.netloc.rpartition("@")[2]
+                connection = connection_cls(proxy_address, timeout=self._config.timeout)
+                if scheme == "https":
+                    connection.set_tunnel(netloc, headers=proxy_headers)
+                else:
+                    self._forwarded[key] = proxy_headers
+            self._connections[key] = connection
+        return connection
+
+    def _send(self, request: Request) -> Tuple[int, bytes]:
+        parts = urlsplit(request.full_url)
+        key = (parts.scheme, parts.netloc)
+        # Pooled connections the server closed while idle are replaced before
+        # use (see ``_is_connection_dropped``). Once the request may have
+        # reached the server it is never retried, because that could submit
+        # (and bill) the same completion twice; a reused connection is only
+        # retried once on a fresh one when sending the request itself failed.
+        reused = key in self._connections
+        while True:
+            connection = self._connection_for(parts.scheme, parts.netloc)
+            forwarded = self._forwarded.get(key)
+            if forwarded is None:
+                target = parts.path or "/"
+                if parts.query:
+                    target = f"{target}?{parts.query}"
+                headers = request.headers
+            else:
+                target = request.full_url
+                headers = {**request.headers, **forwarded}
+            sent = False
+            try:
+                connection.request(
+                    request.get_method(),
+                    target,
+                    body=request.data,
+                    headers=headers,
+                )
+                sent = True
+                response = connection.getresponse()
+                return response.status, response.read()
+            except (HTTPException, OSError) as exc:
+                connection.close()
+                self._connections.pop(key, None)
+                if not reused or sent or isinstance(exc, TimeoutError):
+                    raise OpenAIAPIError("Failed to reach OpenAI API", payload=str(exc)) from exc
+                reused = False
+
     def _execute(self, request: Request) -> Dict[str, Any]:
-        status_code: Optional[int] = None
-        try:
-            with urlopen(request, timeout=self._config.timeout) as response:  # type: ignore[arg-type]
-                body = response.read().decode("utf-8")
-                status_code = getattr(response, "status", response.getcode())
-        except HTTPError as exc:  # pragma: no cover - network errors are rare but handled
-            body = exc.read().decode("utf-8") if exc.fp else ""
+        status_code, body = self._send(request)
+        if status_code >= 400:
             raise OpenAIAPIError(
-                f"OpenAI API request failed with status {exc.code}",
-                status_code=exc.code,
+                f"OpenAI API request failed with status {status_code}",
+                status_code=status_code,
                 payload=body,
-            ) from exc
-        except URLError as exc:  # pragma: no cover - connectivity issues
-            raise OpenAIAPIError("Failed to reach OpenAI API", payload=str(exc)) from exc
+            )
 
         try:
-            payload: Dict[str, Any] = json.loads(body)
-        except json.JSONDecodeError as exc:
+            payload: Dict[str, Any] = _serde.loads(body)
+        except _serde.JSONDecodeError as exc:
             raise OpenAIAPIError(
-                "OpenAI API returned invalid JSON", status_code=status_code, payload=body
-            ) from exc
-        if status_code >= 400:
-            raise OpenAIAPIError(
-                f"OpenAI API returned error status {status_code}",
+                "OpenAI API returned invalid JSON",
                 status_code=status_code,
                 payload=body,
-            )
+            ) from exc
         return payload
 
     def create_chat_completion(self, prompt: StructuredPrompt) -> OpenAIResponse:
@@ -102,3 +211,23 @@ class OpenAIClient:
         response_payload = self._execute(request)
         return OpenAIResponse.from_dict(response_payload)
 
+
+def _is_connection_dropped(connection: HTTPConnection) -> bool:
+    """Return ``True`` if the server has closed the idle ``connection``.
+
+    An idle keep-alive socket only becomes readable when the peer closed it
+    (or sent something unsolicited), either of which makes it unusable.
+    """
+
+    sock = connection.sock
+    if sock is None:
+        # Not connected yet (or closed); ``request`` connects on demand.
+        return False
+    try:
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
@@ -3,18 +3,22 @@
 The :class:`ProjectManager` coordinates the creation, loading and saving of
 projects on the local filesystem. Projects are represented by the
 :class:`Project` dataclass which stores metadata and timestamps that are
-persisted to JSON.
+persisted to JSON. Setting ``MODGEN_BINARY_METADATA=1`` stores new metadata as
+MessagePack instead when :mod:`msgspec` is installed; both formats are read.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import functools
 from datetime import datetime, timezone
-import json
+import os
 import re
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
+from . import _serde
 from .exceptions import (
     InvalidProjectNameError,
     ProjectExistsError,
@@ -24,6 +28,46 @@ from .exceptions import (
 )
 
 PROJECT_FILE_NAME = "project.json"
+BINARY_PROJECT_FILE_NAME = "project.msgpack"
+BINARY_METADATA_ENV_VAR = "MODGEN_BINARY_METADATA"
+INDEX_FILE_NAME = ".index.json"
+
+_SLUG_NON_ALNUM = re.compile(r"[^A-Za-z0-9._-]+")
+_SLUG_REPEAT = re.compile(r"[-_.]{2,}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _slug_for_name(name: str) -> str:
+    """Create a filesystem-friendly slug for ``name``.
+
+    Results are cached because the same names are resolved repeatedly when
+    checking, loading and saving projects.
+    """
+
+    slug = _SLUG_NON_ALNUM.sub("-", name.strip())
+    slug = _SLUG_REPEAT.sub("-", slug)
+    slug = slug.strip("-_.")
+    if not slug:
+        raise InvalidProjectNameError("Project name results in an empty slug")
+    return slug
+
+
+def _utcnow_s() -> datetime:
+    """Return the current UTC time truncated to whole seconds."""
+
+    return datetime.fromtimestamp(int(time.time()), tz=timezone.utc)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never observe a partial file."""
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 @dataclass
@@ -34,12 +78,8 @@ class Project:
     path: Path
     description: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(
-        default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0)
-    )
-    updated_at: datetime = field(
-        default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0)
-    )
+    created_at: datetime = field(default_factory=_utcnow_s)
+    updated_at: datetime = field(default_factory=_utcnow_s)
 
     def __post_init__(self) -> None:
         self.path = Path(self.path)
@@ -79,13 +119,29 @@ class Project:
 
 
 class ProjectManager:
-    """Manage Modgen projects stored on the local filesystem."""
+    """Manage Modgen projects stored on the local filesystem.
+
+    Project names are cached in an index file inside the root directory so
+    that :meth:`list_projects` only re-reads metadata that changed on disk.
+    The file is refreshed when :meth:`list_projects` runs to completion.
+    """
 
     def __init__(self, root_directory: Optional[Path | str] = None) -> None:
         if root_directory is None:
             root_directory = Path.home() / ".modgen" / "projects"
         self._root = Path(root_directory).expanduser().resolve()
         self._root.mkdir(parents=True, exist_ok=True)
+        self._binary_metadata = (
+            os.environ.get(BINARY_METADATA_ENV_VAR) == "1" and _serde.msgspec is not None
+        )
+        # Metadata files are probed in this order; the preferred format first.
+        self._metadata_file_names = (
+            (BINARY_PROJECT_FILE_NAME, PROJECT_FILE_NAME)
+            if self._binary_metadata
+            else (PROJECT_FILE_NAME, BINARY_PROJECT_FILE_NAME)
+        )
+        self._index = self._load_index()
+        self._index_dirty = False
 
     @property
     def root(self) -> Path:
@@ -135,12 +191,30 @@ class ProjectManager:
     def save_project(self, project: Project) -> None:
         """Persist the given project to disk."""
 
-        project.updated_at = datetime.now(timezone.utc).replace(microsecond=0)
+        project.updated_at = _utcnow_s()
         payload = project.to_dict()
-        self._ensure_json_serializable(payload["metadata"])
-        metadata_path = project.path / PROJECT_FILE_NAME
+        preferred_name, other_name = self._metadata_file_names
+        try:
+            if self._binary_metadata:
+                encoded = _serde.dumps_msgpack(payload)
+            else:
+                encoded = _serde.dumps(payload, indent=True)
+        except (TypeError, ValueError) as exc:
+            format_name = "MessagePack" if self._binary_metadata else "JSON"
+            raise ProjectSerializationError(f"Metadata must be {format_name} serialisable") from exc
+        metadata_path = project.path / preferred_name
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        metadata_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+        _atomic_write(metadata_path, encoded)
+        # Drop metadata left behind in the other format so loads stay unambiguous.
+        (project.path / other_name).unlink(missing_ok=True)
+        if metadata_path.parent.parent == self._root:
+            # The index file is only rewritten by ``list_projects``; rewriting
+            # it on every save would make bulk creation quadratic.
+            self._index[metadata_path.parent.name] = {
+                "name": project.name,
+                "mtime": metadata_path.stat().st_mtime_ns,
+            }
+            self._index_dirty = True
 
     def load_project(self, name: str) -> Project:
         """Load a project by name."""
@@ -148,12 +222,12 @@ class ProjectManager:
         project_path = self._project_path_for_name(name)
         if not project_path.exists():
             raise ProjectNotFoundError(f"Project '{name}' does not exist")
-        metadata_path = project_path / PROJECT_FILE_NAME
-        if not metadata_path.exists():
+        found = self._find_metadata(project_path)
+        if found is None:
             raise ProjectNotInitializedError(
-                f"Project '{name}' is missing metadata at {metadata_path}"
+                f"Project '{name}' is missing metadata at {project_path / PROJECT_FILE_NAME}"
             )
-        payload = json.loads(metadata_path.read_text())
+        payload = self._read_metadata(found[0])
         project = Project.from_dict(payload)
         project.path = project_path
         return project
@@ -161,27 +235,82 @@ class ProjectManager:
     def list_projects(self) -> Iterable[str]:
         """Iterate over all project names stored in the root directory."""
 
-        for candidate in sorted(self._root.iterdir()):
-            if not candidate.is_dir():
+        # ``DirEntry.is_dir`` answers from the directory listing itself, and
+        # metadata files are only parsed when the index entry is stale.
+        with os.scandir(self._root) as entries:
+            candidates = sorted(
+                (entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name
+            )
+        index_changed = self._index_dirty
+        seen = set()
+        for candidate in candidates:
+            found = self._find_metadata(Path(candidate.path))
+            if found is None:
                 continue
-            metadata_path = candidate / PROJECT_FILE_NAME
-            if not metadata_path.exists():
+            metadata_path, mtime = found
+            seen.add(candidate.name)
+            cached = self._index.get(candidate.name)
+            if isinstance(cached, dict) and cached.get("mtime") == mtime:
+                yield cached["name"]
                 continue
             try:
-                payload = json.loads(metadata_path.read_text())
-            except json.JSONDecodeError:  # pragma: no cover - defensive branch
+                payload = self._read_metadata(metadata_path)
+            except (FileNotFoundError, ValueError, ProjectSerializationError):  # pragma: no cover - defensive branch
                 continue
-            yield payload.get("name", candidate.name)
+            name = payload.get("name", candidate.name)
+            self._index[candidate.name] = {"name": name, "mtime": mtime}
+            index_changed = True
+            yield name
+        for stale in self._index.keys() - seen:
+            del self._index[stale]
+            index_changed = True
+        if index_changed:
+            self._write_index()
+            self._index_dirty = False
 
     def project_exists(self, name: str) -> bool:
         """Return ``True`` if a project with ``name`` exists."""
 
-        project_path = self._project_path_for_name(name)
-        return project_path.exists() and (project_path / PROJECT_FILE_NAME).exists()
+        return self._find_metadata(self._project_path_for_name(name)) is not None
+
+    def _find_metadata(self, project_path: Path) -> Optional[Tuple[Path, int]]:
+        """Return the metadata file of ``project_path`` and its ``st_mtime_ns``."""
+
+        for file_name in self._metadata_file_names:
+            metadata_path = project_path / file_name
+            try:
+                return metadata_path, metadata_path.stat().st_mtime_ns
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return None
+
+    @staticmethod
+    def _read_metadata(metadata_path: Path) -> Dict[str, Any]:
+        data = metadata_path.read_bytes()
+        if metadata_path.name != BINARY_PROJECT_FILE_NAME:
+            return _serde.loads(data)
+        try:
+            return _serde.loads_msgpack(data)
+        except (RuntimeError, ValueError) as exc:
+            raise ProjectSerializationError(
+                f"Cannot read binary metadata at {metadata_path}: {exc}"
+            ) from exc
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cached ``slug -> {name, mtime}`` index for the root."""
+
+        # The index is only a cache: any unreadable file means starting over.
+        try:
+            index = _serde.loads((self._root / INDEX_FILE_NAME).read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self) -> None:
+        _atomic_write(self._root / INDEX_FILE_NAME, _serde.dumps(self._index))
 
     def _project_path_for_name(self, name: str) -> Path:
-        slug = self._slugify(name)
-        return self._root / slug
+        return self._root / self._slugify(name)
 
     @staticmethod
     def _slugify(name: str) -> str:
@@ -189,16 +318,4 @@ class ProjectManager:
 
         if not isinstance(name, str):
             raise InvalidProjectNameError("Project name must be a string")
-        slug = re.sub(r"[^A-Za-z0-9._-]+", "-", name.strip())
-        slug = re.sub(r"[-_.]{2,}", "-", slug)
-        slug = slug.strip("-_.")
-        if not slug:
-            raise InvalidProjectNameError("Project name results in an empty slug")
-        return slug
-
-    @staticmethod
-    def _ensure_json_serializable(metadata: Dict[str, Any]) -> None:
-        try:
-            json.dumps(metadata)
-        except (TypeError, ValueError) as exc:  # pragma: no cover - simple passthrough
-            raise ProjectSerializationError("Metadata must be JSON serialisable") from exc
+        return _slug_for_name(name)
@@ -2,17 +2,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Sequence, Tuple
 
-_ALLOWED_ROLES: Tuple[str, ...] = ("system", "user", "assistant", "tool")
+_ROLE_NAMES: Tuple[str, ...] = ("system", "user", "assistant", "tool")
+_ALLOWED_ROLES: FrozenSet[str] = frozenset(_ROLE_NAMES)
+
+_RESERVED_PAYLOAD_KEYS: FrozenSet[str] = frozenset(
+    ("model", "messages", "temperature", "max_tokens", "response_format")
+)
 
 
 class PromptValidationError(ValueError):
     """Raised when a prompt is constructed with invalid data."""
 
 
-@dataclass(frozen=True)
-class PromptMessage:
+class _PayloadCache:
+    # A plain slot rather than a dataclass field, so the cache stays out of
+    # fields(), asdict() and the generated __init__/__repr__/__eq__.
+    __slots__ = ("_payload",)
+
+
+@dataclass(frozen=True, slots=True)
+class PromptMessage(_PayloadCache):
     """A single message that forms part of a chat prompt."""
 
     role: str
@@ -22,19 +33,28 @@ class PromptMessage:
     def __post_init__(self) -> None:
         if self.role not in _ALLOWED_ROLES:
             raise PromptValidationError(
-                f"Invalid role '{self.role}'. Expected one of {', '.join(_ALLOWED_ROLES)}"
+                f"Invalid role '{self.role}'. Expected one of {', '.join(_ROLE_NAMES)}"
             )
         if self.content is None:
             raise PromptValidationError("Prompt message content cannot be None")
 
     def to_dict(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"role": self.role, "content": self.content}
-        if self.name:
-            payload["name"] = self.name
-        return payload
-
-
-@dataclass(frozen=True)
+        return dict(self._api_payload())
+
+    def _api_payload(self) -> Dict[str, Any]:
+        # Messages are immutable, so the API representation is built once.
+        # Copies and unpickled instances only restore the fields, hence lazily.
+        try:
+            return self._payload
+        except AttributeError:
+            payload: Dict[str, Any] = {"role": self.role, "content": self.content}
+            if self.name:
+                payload["name"] = self.name
+            object.__setattr__(self, "_payload", payload)
+            return payload
+
+
+@dataclass(frozen=True, slots=True)
 class StructuredPrompt:
     """Represents a full structured prompt for the chat completions API."""
 
@@ -50,9 +70,13 @@ class StructuredPrompt:
             raise PromptValidationError("A model must be provided for the prompt")
         if not self.messages:
             raise PromptValidationError("At least one message is required to build a prompt")
+        # Normalise mappings to plain dicts once so to_payload can use them as-is.
+        if self.response_format is not None and not isinstance(self.response_format, dict):
+            object.__setattr__(self, "response_format", dict(self.response_format))
+        if not isinstance(self.extra_parameters, dict):
+            object.__setattr__(self, "extra_parameters", dict(self.extra_parameters))
         # Validate extra parameters do not collide with reserved keys.
-        reserved = {"model", "messages", "temperature", "max_tokens", "response_format"}
-        conflicts = reserved.intersection(self.extra_parameters.keys())
+        conflicts = _RESERVED_PAYLOAD_KEYS.intersection(self.extra_parameters)
         if conflicts:
             conflict_str = ", ".join(sorted(conflicts))
             raise PromptValidationError(
@@ -62,16 +86,16 @@ class StructuredPrompt:
     def to_payload(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": self.model,
-            "messages": [message.to_dict() for message in self.messages],
+            "messages": [message._api_payload() for message in self.messages],
         }
         if self.temperature is not None:
             payload["temperature"] = self.temperature
         if self.max_tokens is not None:
             payload["max_tokens"] = self.max_tokens
         if self.response_format is not None:
-            payload["response_format"] = dict(self.response_format)
+            payload["response_format"] = self.response_format
         if self.extra_parameters:
-            payload.update(dict(self.extra_parameters))
+            payload.update(self.extra_parameters)
         return payload
 
     @classmethod
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional
 from .prompt import PromptMessage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Usage:
     """Token usage metrics returned by the API."""
 
@@ -24,7 +24,7 @@ class Usage:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Choice:
     """A single choice returned by a chat completion response."""
 
@@ -47,7 +47,7 @@ class Choice:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenAIResponse:
     """Structured representation of a response from OpenAI."""
 
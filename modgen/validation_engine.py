@@ -8,12 +8,28 @@ collects any issues that were discovered.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+import functools
+import hashlib
 import json
+import os
+import re
+import threading
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import javalang
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    simdjson = None
+
+from . import _serde
+
+if TYPE_CHECKING:
+    import tree_sitter
 
 
 @dataclass(frozen=True)
@@ -54,12 +70,72 @@ class ValidationResult:
 
 
 class ValidationEngine:
-    """Perform syntax and file structure validation for project assets."""
+    """Perform syntax and file structure validation for project assets.
+
+    JSON payloads are checked with simdjson when ``pysimdjson`` is installed,
+    and Java sources with the native tree-sitter parser when the
+    ``tree-sitter-java`` grammar is installed; otherwise the standard library
+    and javalang are used. Engines hold no parser state of their own and may
+    be shared between threads.
+
+    The Java backends validate different language levels. tree-sitter
+    accepts modern Java (records, modules, sealed types, switch expressions,
+    text blocks and ``instanceof`` patterns) and rejects malformed numeric
+    literals such as ``08``; javalang only understands Java 8 and lets those
+    literals through.
+    """
 
     def validate_json(
-        self, payload: str, *, source_path: Optional[Path] = None
+        self, payload: str | bytes, *, source_path: Optional[Path] = None
     ) -> ValidationResult:
-        """Validate that ``payload`` contains valid JSON syntax."""
+        """Validate that ``payload`` contains valid JSON syntax.
+
+        ``payload`` may be text or UTF-8 encoded bytes, such as the contents
+        of a file read with :meth:`pathlib.Path.read_bytes`.
+        """
+
+        if self._fast_json_check(payload):
+            return ValidationResult()
+        # Only payloads the fast parser rejects are cached: for valid documents
+        # hashing the payload would cost more than parsing it again.
+        key = _source_digest(payload)
+        issues = _JSON_ISSUE_CACHE.get(key)
+        if issues is None:
+            issues = tuple(self._parse_json(payload).issues)
+            _JSON_ISSUE_CACHE.put(key, issues)
+        return _result_for(issues, source_path)
+
+    def _fast_json_check(self, payload: str | bytes) -> bool:
+        """Return ``True`` if the fast JSON parser accepts ``payload``."""
+
+        parser = _json_parser()
+        if parser is not None:
+            # simdjson skips a leading byte order mark, which the standard
+            # library only accepts in bytes (as UTF-8-sig), never in text.
+            if isinstance(payload, str) and payload.startswith("\ufeff"):
+                return False
+            # Only the structural check matters; the lazy document simdjson
+            # returns is discarded immediately so the parser can be reused.
+            try:
+                parser.parse(
+                    payload.encode("utf-8") if isinstance(payload, str) else payload
+                )
+            except (RuntimeError, ValueError):
+                return False
+            return True
+        try:
+            _serde.loads(payload)
+        except (_serde.JSONDecodeError, UnicodeDecodeError):
+            return False
+        return True
+
+    def _parse_json(self, payload: str | bytes) -> ValidationResult:
+        """Parse ``payload`` and report issues without a source path.
+
+        The standard library parser is authoritative: it reports the exact
+        error position and accepts documents the fast parsers reject (e.g.
+        NaN or integers wider than 64 bits).
+        """
 
         result = ValidationResult()
         try:
@@ -68,12 +144,9 @@ class ValidationEngine:
             message = (
                 f"JSON syntax error: {exc.msg} (line {exc.lineno} column {exc.colno})"
             )
-            result.add_issue(
-                message,
-                path=source_path,
-                line=exc.lineno,
-                column=exc.colno,
-            )
+            result.add_issue(message, line=exc.lineno, column=exc.colno)
+        except UnicodeDecodeError as exc:
+            result.add_issue(f"JSON syntax error: invalid UTF-8 at byte {exc.start}")
         return result
 
     def validate_java(
@@ -81,11 +154,35 @@ class ValidationEngine:
     ) -> ValidationResult:
         """Validate that ``source`` contains syntactically valid Java."""
 
-        result = ValidationResult()
         if not source.strip():
+            result = ValidationResult()
             result.add_issue("Java source is empty", path=source_path)
             return result
 
+        key = _source_digest(source)
+        issues = _JAVA_ISSUE_CACHE.get(key)
+        if issues is None:
+            issues = tuple(self._parse_java(source).issues)
+            _JAVA_ISSUE_CACHE.put(key, issues)
+        return _result_for(issues, source_path)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached validation results shared by all engines."""
+
+        _JSON_ISSUE_CACHE.clear()
+        _JAVA_ISSUE_CACHE.clear()
+
+    def _parse_java(self, source: str) -> ValidationResult:
+        """Parse ``source`` and report issues without a source path."""
+
+        result = ValidationResult()
+        parser = _java_parser()
+        if parser is not None:
+            self._collect_tree_sitter_issues(parser, source, result)
+            return result
+
+        javalang = _javalang()
         try:
             javalang.parse.parse(source)
         except javalang.parser.JavaSyntaxError as exc:
@@ -95,7 +192,6 @@ class ValidationEngine:
             description = getattr(exc, "description", str(exc))
             result.add_issue(
                 f"Java syntax error: {description}",
-                path=source_path,
                 line=line,
                 column=column,
             )
@@ -103,17 +199,64 @@ class ValidationEngine:
             line, column = self._extract_position(getattr(exc, "position", None))
             result.add_issue(
                 f"Java lexical error: {exc}",
-                path=source_path,
                 line=line,
                 column=column,
             )
         except ValueError as exc:  # pragma: no cover - defensive branch
-            result.add_issue(
-                f"Java parsing failed: {exc}",
-                path=source_path,
-            )
+            result.add_issue(f"Java parsing failed: {exc}")
         return result
 
+    def validate_java_batch(
+        self,
+        sources: Iterable[Tuple[Path, str]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> Dict[Path, ValidationResult]:
+        """Validate many Java sources, keyed by their path.
+
+        The native tree-sitter parser is far cheaper than starting worker
+        processes, so with it (or with ``max_workers=1``) the batch runs in the
+        current process. The pure-Python javalang fallback is CPU-bound, so
+        sources missing from the shared cache are spread across a process pool
+        of ``max_workers`` processes (one per CPU by default) and the workers'
+        issues are cached for later calls.
+        """
+
+        items = list(sources)
+        workers = max_workers or os.cpu_count() or 1
+        if len(items) < 2 or workers == 1 or _java_parser() is not None:
+            return {path: self.validate_java(source, source_path=path) for path, source in items}
+
+        keys = [_source_digest(source) if source.strip() else None for _, source in items]
+        issues_by_key: Dict[bytes, Tuple[ValidationIssue, ...]] = {}
+        missing: Dict[bytes, str] = {}
+        for key, (_, source) in zip(keys, items):
+            if key is None or key in issues_by_key or key in missing:
+                continue
+            issues = _JAVA_ISSUE_CACHE.get(key)
+            if issues is None:
+                missing[key] = source
+            else:
+                issues_by_key[key] = issues
+
+        # A single miss is parsed below by validate_java; a pool would only add start-up cost.
+        if len(missing) > 1:
+            workers = min(workers, len(missing))
+            chunksize = max(1, len(missing) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = executor.map(_java_issues, missing.values(), chunksize=chunksize)
+                for key, issues in zip(missing, parsed):
+                    _JAVA_ISSUE_CACHE.put(key, issues)
+                    issues_by_key[key] = issues
+
+        results: Dict[Path, ValidationResult] = {}
+        for key, (path, source) in zip(keys, items):
+            if key in issues_by_key:
+                results[path] = _result_for(issues_by_key[key], path)
+            else:
+                results[path] = self.validate_java(source, source_path=path)
+        return results
+
     def validate_file_structure(
         self,
         root: Path | str,
@@ -127,36 +270,107 @@ class ValidationEngine:
             result.add_issue(f"Root path does not exist: {root_path}", path=root_path)
             return result
 
+        # Each parent directory is listed once; a real stat is only needed
+        # when an entry is missing from the listing (e.g. ``..`` components or
+        # case-insensitive filesystems).
+        listings: Dict[Path, Dict[str, Optional[bool]]] = {}
         for entry in expected_entries:
             normalized_entry = entry.rstrip("/")
             expected_path = root_path / Path(normalized_entry)
             expect_directory = entry.endswith("/")
 
+            parent = expected_path.parent
+            listing = listings.get(parent)
+            if listing is None:
+                listing = listings[parent] = self._list_directory(parent)
+            is_dir = listing.get(expected_path.name)
+            if is_dir is None and expected_path.exists():
+                is_dir = expected_path.is_dir()
+
             if expect_directory:
-                if not expected_path.exists():
+                if is_dir is None:
                     result.add_issue(
                         f"Missing directory: {expected_path}",
                         path=expected_path,
                     )
-                elif not expected_path.is_dir():
+                elif not is_dir:
                     result.add_issue(
                         f"Expected directory but found file: {expected_path}",
                         path=expected_path,
                     )
                 continue
 
-            if not expected_path.exists():
+            if is_dir is None:
                 result.add_issue(
                     f"Missing file: {expected_path}",
                     path=expected_path,
                 )
-            elif expected_path.is_dir():
+            elif is_dir:
                 result.add_issue(
                     f"Expected file but found directory: {expected_path}",
                     path=expected_path,
                 )
         return result
 
+    @staticmethod
+    def _list_directory(directory: Path) -> Dict[str, Optional[bool]]:
+        """Map entry names in ``directory`` to whether they are directories.
+
+        Broken symbolic links map to ``None`` so that they are treated as
+        missing, as :meth:`pathlib.Path.exists` would.
+        """
+
+        try:
+            with os.scandir(directory) as entries:
+                return {
+                    entry.name: (
+                        entry.is_dir()
+                        if not entry.is_symlink() or os.path.exists(entry.path)
+                        else None
+                    )
+                    for entry in entries
+                }
+        except OSError:
+            return {}
+
+    def _collect_tree_sitter_issues(
+        self, parser: tree_sitter.Parser, source: str, result: ValidationResult
+    ) -> None:
+        encoded = source.encode("utf-8", errors="surrogatepass")
+        root = parser.parse(encoded).root_node
+        # The grammar is more permissive than the language: it accepts
+        # statements at the top level and ``goto``/``const`` as identifiers,
+        # so those are reported on top of the parse errors.
+        issues: List[Tuple[tree_sitter.Node, str]] = []
+        if root.has_error:
+            for node in _syntax_error_nodes(root):
+                if node.is_missing:
+                    issues.append((node, f"missing '{node.type}'"))
+                else:
+                    issues.append((node, "unexpected syntax"))
+        issues.extend(
+            (node, "expected type declaration") for node in _misplaced_top_level_nodes(root)
+        )
+        if _RESERVED_WORD.search(source):
+            issues.extend(
+                (node, f"reserved keyword '{word}'")
+                for node, word in _reserved_identifier_nodes(root, encoded)
+            )
+        issues.sort(key=lambda issue: issue[0].start_byte)
+
+        for node, description in issues:
+            row, byte_column = node.start_point
+            # tree-sitter reports byte offsets; convert to a character column
+            # by counting the bytes that start a code point (lone surrogates
+            # are encoded like any other three-byte sequence).
+            line_prefix = encoded[node.start_byte - byte_column : node.start_byte]
+            column = sum(not 0x80 <= byte < 0xC0 for byte in line_prefix) + 1
+            result.add_issue(
+                f"Java syntax error: {description}",
+                line=row + 1,
+                column=column,
+            )
+
     @staticmethod
     def _extract_position(
         position: Optional[Tuple[int | None, int | None]]
@@ -165,3 +379,169 @@ class ValidationEngine:
             return None, None
         line, column = position
         return line, column
+
+
+class _IssueCache:
+    """Thread-safe LRU mapping of source digests to the issues they produced.
+
+    Keys are fixed-size digests so that large sources are not retained.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, Tuple[ValidationIssue, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Tuple[ValidationIssue, ...]]:
+        with self._lock:
+            issues = self._entries.get(key)
+            if issues is not None:
+                self._entries.move_to_end(key)
+            return issues
+
+    def put(self, key: bytes, issues: Tuple[ValidationIssue, ...]) -> None:
+        with self._lock:
+            self._entries[key] = issues
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_JSON_ISSUE_CACHE = _IssueCache(maxsize=2048)
+_JAVA_ISSUE_CACHE = _IssueCache(maxsize=1024)
+
+
+def _source_digest(source: str | bytes) -> bytes:
+    if isinstance(source, str):
+        source = source.encode("utf-8", errors="surrogatepass")
+    return hashlib.blake2b(source, digest_size=16).digest()
+
+
+def _result_for(
+    issues: Tuple[ValidationIssue, ...], source_path: Optional[Path]
+) -> ValidationResult:
+    """Build a fresh result from cached path-less ``issues``."""
+
+    if source_path is None:
+        return ValidationResult(list(issues))
+    return ValidationResult([replace(issue, path=source_path) for issue in issues])
+
+
+# The Java parsers are imported on first use so that importing this module
+# (and therefore ``modgen``) stays cheap for callers that never validate Java.
+@functools.lru_cache(maxsize=None)
+def _javalang() -> ModuleType:
+    import javalang
+
+    return javalang
+
+
+# Native parsers keep per-parse state and must not be shared between threads,
+# so each thread builds its own on first use.
+_PARSERS = threading.local()
+
+
+def _json_parser() -> Optional[simdjson.Parser]:
+    """Return this thread's simdjson parser, or ``None`` if it is unavailable."""
+
+    if simdjson is None:
+        return None
+    parser = getattr(_PARSERS, "json", None)
+    if parser is None:
+        parser = _PARSERS.json = simdjson.Parser()
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def _java_language() -> Optional[tree_sitter.Language]:
+    """Load the tree-sitter Java grammar once per process."""
+
+    try:
+        import tree_sitter
+        import tree_sitter_java
+    except ImportError:  # pragma: no cover - depends on the installed extras
+        return None
+    return tree_sitter.Language(tree_sitter_java.language())
+
+
+def _java_parser() -> Optional[tree_sitter.Parser]:
+    """Return this thread's tree-sitter Java parser, or ``None``."""
+
+    parser = getattr(_PARSERS, "java", None)
+    if parser is None:
+        language = _java_language()
+        if language is None:
+            return None
+        import tree_sitter
+
+        parser = _PARSERS.java = tree_sitter.Parser(language)
+    return parser
+
+
+def _syntax_error_nodes(root: tree_sitter.Node) -> Iterable[tree_sitter.Node]:
+    """Yield the outermost error and missing nodes below ``root`` in order."""
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.is_error or node.is_missing:
+            yield node
+        elif node.has_error:
+            stack.extend(reversed(node.children))
+
+
+# Order in which compilation unit members may appear; a package declaration
+# may appear at most once.
+_TOP_LEVEL_RANKS = {
+    "package_declaration": 0,
+    "import_declaration": 1,
+    "class_declaration": 2,
+    "interface_declaration": 2,
+    "enum_declaration": 2,
+    "annotation_type_declaration": 2,
+    "record_declaration": 2,
+    "module_declaration": 2,
+}
+_TOP_LEVEL_IGNORED = frozenset({";", "line_comment", "block_comment", "ERROR"})
+_RESERVED_WORD = re.compile(r"\b(?:goto|const)\b")
+_IDENTIFIER_TYPES = frozenset({"identifier", "type_identifier"})
+
+
+def _misplaced_top_level_nodes(root: tree_sitter.Node) -> Iterable[tree_sitter.Node]:
+    """Yield children of ``root`` that may not appear in a compilation unit."""
+
+    current = -1
+    for node in root.children:
+        if node.type in _TOP_LEVEL_IGNORED or node.is_missing:
+            continue
+        rank = _TOP_LEVEL_RANKS.get(node.type)
+        if rank is None or rank < current or rank == current == 0:
+            yield node
+        else:
+            current = rank
+
+
+def _reserved_identifier_nodes(
+    root: tree_sitter.Node, encoded: bytes
+) -> Iterable[Tuple[tree_sitter.Node, str]]:
+    """Yield identifiers in ``root`` that spell a reserved Java keyword."""
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.type in _IDENTIFIER_TYPES:
+            word = encoded[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
+            if _RESERVED_WORD.fullmatch(word):
+                yield node, word
+        else:
+            stack.extend(reversed(node.children))
+
+
+def _java_issues(source: str) -> Tuple[ValidationIssue, ...]:
+    """Process pool entry point for :meth:`ValidationEngine.validate_java_batch`."""
+
+    return tuple(ValidationEngine()._parse_java(source).issues)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from modgen import ProjectManager
+
+
+@pytest.fixture
+def rng() -> random.Random:
+    """A freshly seeded RNG so randomised inputs are identical on every run."""
+
+    return random.Random(0xC0FFEE)
+
+
+@pytest.fixture(scope="session")
+def _template_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a pre-populated project root once per test session."""
+
+    template = tmp_path_factory.mktemp("template-workspace")
+    manager = ProjectManager(template)
+    manager.create_project("Duplicate")
+    manager.create_project("Example One")
+    manager.create_project("Example Two")
+    manager.create_project("Roundtrip", metadata={"version": 1})
+    return template
+
+
+@pytest.fixture
+def project_workspace(_template_workspace: Path, tmp_path: Path) -> ProjectManager:
+    """Return a manager bound to a private copy of the template workspace."""
+
+    workspace = tmp_path / "ws"
+    shutil.copytree(_template_workspace, workspace, dirs_exist_ok=True)
+    return ProjectManager(workspace)
+
+
+@pytest.fixture(scope="module")
+def java_src_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only project tree with ``src/Example.java``."""
+
+    base = tmp_path_factory.mktemp("java")
+    (base / "src").mkdir()
+    (base / "src" / "Example.java").write_text("class Example {}\n")
+    return base
+
+
+@pytest.fixture(scope="module")
+def empty_src_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only project tree with an empty ``src/`` directory."""
+
+    base = tmp_path_factory.mktemp("java-empty")
+    (base / "src").mkdir()
+    return base
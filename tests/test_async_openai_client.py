@@ -0,0 +1,143 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from modgen.async_openai_client import AsyncOpenAIClient
+from modgen.openai_client import OpenAIAPIError
+from modgen.prompt import PromptMessage, StructuredPrompt
+
+
+def _connection_returning(body: bytes, status: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.read.return_value = body
+    response.status = status
+    connection = MagicMock()
+    connection.sock = None
+    connection.getresponse.return_value = response
+    return connection
+
+
+class AsyncOpenAIClientTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.prompt = StructuredPrompt(
+            model="gpt-test",
+            messages=[PromptMessage(role="user", content="Say hi")],
+        )
+        self.body = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "model": "gpt-test",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "Hello there!"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        ).encode("utf-8")
+
+    @patch("modgen.openai_client.HTTPSConnection")
+    async def test_gather_uses_bounded_connection_pool(self, mock_connection_cls: MagicMock) -> None:
+        mock_connection_cls.side_effect = lambda *args, **kwargs: _connection_returning(self.body)
+
+        async with AsyncOpenAIClient(api_key="test-key", max_connections=2) as client:
+            results = await asyncio.gather(
+                *(client.create_chat_completion(self.prompt) for _ in range(5))
+            )
+
+        self.assertEqual([result.id for result in results], ["chatcmpl-123"] * 5)
+        self.assertLessEqual(mock_connection_cls.call_count, 2)
+
+    @patch("modgen.openai_client.HTTPSConnection")
+    async def test_idle_connections_beyond_keepalive_limit_are_closed(
+        self, mock_connection_cls: MagicMock
+    ) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+        connections = []
+
+        def make_connection(*args, **kwargs):
+            connection = _connection_returning(self.body)
+            connection.request.side_effect = lambda *a, **k: barrier.wait()
+            connections.append(connection)
+            return connection
+
+        mock_connection_cls.side_effect = make_connection
+
+        client = AsyncOpenAIClient(
+            api_key="test-key", max_connections=3, max_keepalive_connections=1
+        )
+        await asyncio.gather(*(client.create_chat_completion(self.prompt) for _ in range(3)))
+
+        self.assertEqual(len(connections), 3)
+        self.assertEqual(sum(c.close.called for c in connections), 2)
+        await client.aclose()
+        self.assertTrue(all(c.close.called for c in connections))
+
+    @patch("modgen.openai_client.HTTPSConnection")
+    async def test_cancelled_request_closes_its_connection(
+        self, mock_connection_cls: MagicMock
+    ) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        connection = _connection_returning(self.body)
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+
+        connection.request.side_effect = slow_request
+        mock_connection_cls.return_value = connection
+
+        async with AsyncOpenAIClient(api_key="test-key") as client:
+            task = asyncio.create_task(client.create_chat_completion(self.prompt))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            connection.close.assert_not_called()
+            release.set()
+            await asyncio.to_thread(client._executor.shutdown)
+
+        connection.close.assert_called_once()
+
+    @patch("modgen.openai_client.HTTPSConnection")
+    async def test_in_flight_request_is_not_pooled_after_aclose(
+        self, mock_connection_cls: MagicMock
+    ) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        connection = _connection_returning(self.body)
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+
+        connection.request.side_effect = slow_request
+        mock_connection_cls.return_value = connection
+
+        client = AsyncOpenAIClient(api_key="test-key")
+        task = asyncio.create_task(client.create_chat_completion(self.prompt))
+        await asyncio.to_thread(started.wait, 5)
+        await client.aclose()
+        release.set()
+
+        self.assertEqual((await task).id, "chatcmpl-123")
+        connection.close.assert_called_once()
+        with self.assertRaises(OpenAIAPIError):
+            await client.create_chat_completion(self.prompt)
+
+    @patch("modgen.openai_client.HTTPSConnection")
+    async def test_http_error_is_raised(self, mock_connection_cls: MagicMock) -> None:
+        mock_connection_cls.return_value = _connection_returning(b"{}", status=429)
+
+        async with AsyncOpenAIClient(api_key="test-key") as client:
+            with self.assertRaises(OpenAIAPIError) as ctx:
+                await client.create_chat_completion(self.prompt)
+        self.assertEqual(ctx.exception.status_code, 429)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import pytest
+
+import modgen
+
+
+def test_import_does_not_load_submodules() -> None:
+    code = (
+        "import sys, modgen; "
+        "print(sorted(m for m in sys.modules if m.startswith('modgen.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "[]"
+
+
+@pytest.mark.parametrize("name", modgen.__all__)
+def test_public_names_resolve(name: str) -> None:
+    value = getattr(modgen, name)
+    assert value.__name__ == name
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        modgen.DoesNotExist
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import datetime
+import enum
 import json
+import math
+import os
+import random
+import uuid
 from pathlib import Path
 
 import pytest
@@ -29,9 +35,10 @@ def test_create_project_creates_directory_and_metadata(tmp_path: Path) -> None:
     assert data["metadata"] == {"language": "python"}
 
 
-def test_save_and_load_project_roundtrip(tmp_path: Path) -> None:
-    manager = ProjectManager(tmp_path)
-    project = manager.create_project("Roundtrip", metadata={"version": 1})
+def test_save_and_load_project_roundtrip(project_workspace: ProjectManager) -> None:
+    manager = project_workspace
+    project = manager.load_project("Roundtrip")
+    assert project.metadata == {"version": 1}
     project.description = "Updated"
     project.metadata["version"] = 2
 
@@ -43,39 +50,212 @@ def test_save_and_load_project_roundtrip(tmp_path: Path) -> None:
     assert loaded.created_at <= loaded.updated_at
 
 
-def test_project_exists_and_list_projects(tmp_path: Path) -> None:
-    manager = ProjectManager(tmp_path)
-    manager.create_project("Example One")
-    manager.create_project("Example Two")
+def test_project_exists_and_list_projects(project_workspace: ProjectManager) -> None:
+    manager = project_workspace
 
     assert manager.project_exists("Example One")
-    assert sorted(manager.list_projects()) == ["Example One", "Example Two"]
+    assert sorted(manager.list_projects()) == [
+        "Duplicate",
+        "Example One",
+        "Example Two",
+        "Roundtrip",
+    ]
 
 
-def test_create_existing_project_without_overwrite_raises(tmp_path: Path) -> None:
+def test_list_projects_uses_index_until_metadata_changes(tmp_path: Path) -> None:
     manager = ProjectManager(tmp_path)
-    manager.create_project("Duplicate")
+    manager.create_project("Indexed")
+    assert not (tmp_path / ".index.json").exists()
+    assert list(manager.list_projects()) == ["Indexed"]
+    index = json.loads((tmp_path / ".index.json").read_text())
+    assert index["Indexed"]["name"] == "Indexed"
 
-    with pytest.raises(ProjectExistsError):
-        manager.create_project("Duplicate")
+    metadata_path = tmp_path / "Indexed" / "project.json"
+    data = json.loads(metadata_path.read_text())
+    data["name"] = "Renamed"
+    metadata_path.write_text(json.dumps(data))
+    stat = metadata_path.stat()
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
 
+    manager = ProjectManager(tmp_path)
+    assert list(manager.list_projects()) == ["Renamed"]
+    index = json.loads((tmp_path / ".index.json").read_text())
+    assert index["Indexed"]["name"] == "Renamed"
 
-def test_invalid_name_raises(tmp_path: Path) -> None:
+
+def test_list_projects_prunes_removed_projects_from_index(tmp_path: Path) -> None:
     manager = ProjectManager(tmp_path)
+    manager.create_project("Keep")
+    manager.create_project("Drop")
+    (tmp_path / "Drop" / "project.json").unlink()
+
+    assert list(manager.list_projects()) == ["Keep"]
+    index = json.loads((tmp_path / ".index.json").read_text())
+    assert set(index) == {"Keep"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b'{"a\xff": 1}', b"{not json", b"[1, 2]"],
+    ids=["invalid-utf8", "invalid-json", "not-a-mapping"],
+)
+def test_unreadable_index_is_ignored(tmp_path: Path, content: bytes) -> None:
+    ProjectManager(tmp_path).create_project("Survivor")
+    (tmp_path / ".index.json").write_bytes(content)
+
+    assert list(ProjectManager(tmp_path).list_projects()) == ["Survivor"]
+
+
+@pytest.mark.parametrize(
+    ("action", "name", "exc"),
+    [
+        ("create_project", "***", InvalidProjectNameError),
+        ("load_project", "Missing", ProjectNotFoundError),
+        ("create_project", "Duplicate", ProjectExistsError),
+    ],
+)
+def test_error_cases(
+    project_workspace: ProjectManager, action: str, name: str, exc: type[Exception]
+) -> None:
+    with pytest.raises(exc):
+        getattr(project_workspace, action)(name)
 
-    with pytest.raises(InvalidProjectNameError):
-        manager.create_project("***")
 
+@pytest.mark.parametrize(
+    ("name", "slug"),
+    [
+        ("My Project", "My-Project"),
+        ("  padded\tname  ", "padded-name"),
+        ("a -- b", "a-b"),
+        ("v1.2_final", "v1.2_final"),
+        ("..hidden..", "hidden"),
+        ("caf\u00e9 menu", "caf-menu"),
+    ],
+)
+def test_project_directory_slugs(tmp_path: Path, name: str, slug: str) -> None:
+    project = ProjectManager(tmp_path).create_project(name)
+
+    assert project.path == tmp_path.resolve() / slug
+
+
+class _Colour(enum.Enum):
+    RED = "red"
+
+
+@pytest.fixture(params=["json", "msgpack"])
+def metadata_format(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test once per metadata file format."""
+
+    if request.param == "msgpack":
+        pytest.importorskip("msgspec")
+        monkeypatch.setenv("MODGEN_BINARY_METADATA", "1")
+    return request.param
 
-def test_missing_project_raises(tmp_path: Path) -> None:
+
+@pytest.mark.parametrize(
+    "value",
+    [object(), _Colour.RED, uuid.UUID(int=0), datetime.date(2024, 1, 1)],
+    ids=["object", "enum", "uuid", "date"],
+)
+def test_non_serialisable_metadata_raises(
+    tmp_path: Path, metadata_format: str, value: object
+) -> None:
     manager = ProjectManager(tmp_path)
 
-    with pytest.raises(ProjectNotFoundError):
-        manager.load_project("Missing")
+    with pytest.raises(ProjectSerializationError):
+        manager.create_project("Invalid Metadata", metadata={"bad": value})
+
+
+def test_failed_save_keeps_previous_metadata(
+    project_workspace: ProjectManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = project_workspace.load_project("Roundtrip")
+    project.metadata["version"] = 2
 
+    def failing_replace(src, dst):
+        raise OSError("disk full")
 
-def test_non_serialisable_metadata_raises(tmp_path: Path) -> None:
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        project_workspace.save_project(project)
+    monkeypatch.undo()
+
+    assert project_workspace.load_project("Roundtrip").metadata == {"version": 1}
+    assert not list(project.path.glob("*.tmp"))
+
+
+def test_metadata_keeps_stdlib_json_semantics(tmp_path: Path) -> None:
     manager = ProjectManager(tmp_path)
+    big = (1 << 70) + 1  # not representable as a float
+    manager.create_project("Semantics", metadata={1: "one", "big": big, "nan": math.nan})
+
+    data = json.loads((tmp_path / "Semantics" / "project.json").read_text())
+    assert data["metadata"]["1"] == "one"
+    assert data["metadata"]["big"] == big
+    assert math.isnan(data["metadata"]["nan"])
+
+    metadata = manager.load_project("Semantics").metadata
+    assert metadata["big"] == big
+    assert math.isnan(metadata["nan"])
+    assert list(ProjectManager(tmp_path).list_projects()) == ["Semantics"]
+
+
+def test_binary_metadata_roundtrip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("msgspec")
+    ProjectManager(tmp_path).create_project("Legacy", metadata={"format": "json"})
+
+    monkeypatch.setenv("MODGEN_BINARY_METADATA", "1")
+    manager = ProjectManager(tmp_path)
+    project = manager.create_project("Binary", metadata={"version": 1})
+    assert (tmp_path / "Binary" / "project.msgpack").exists()
+    assert not (tmp_path / "Binary" / "project.json").exists()
+
+    project.metadata["version"] = 2
+    manager.save_project(project)
+    assert manager.load_project("Binary").metadata == {"version": 2}
+    assert manager.load_project("Legacy").metadata == {"format": "json"}
+    assert sorted(manager.list_projects()) == ["Binary", "Legacy"]
+
+    monkeypatch.delenv("MODGEN_BINARY_METADATA")
+    manager = ProjectManager(tmp_path)
+    manager.save_project(manager.load_project("Binary"))
+    assert (tmp_path / "Binary" / "project.json").exists()
+    assert not (tmp_path / "Binary" / "project.msgpack").exists()
+
+
+def test_binary_metadata_matches_json_semantics(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("msgspec")
+    metadata = {1: "one", None: "none", "tags": ("a", "b"), "nan": math.nan}
+    ProjectManager(tmp_path).create_project("Text", metadata=metadata)
+    monkeypatch.setenv("MODGEN_BINARY_METADATA", "1")
+    manager = ProjectManager(tmp_path)
+    manager.create_project("Binary", metadata=metadata)
+
+    text = manager.load_project("Text").metadata
+    binary = manager.load_project("Binary").metadata
+    assert repr(binary) == repr(text)
+    assert binary["1"] == "one"
+
+
+def test_truncated_binary_metadata_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("msgspec")
+    monkeypatch.setenv("MODGEN_BINARY_METADATA", "1")
+    manager = ProjectManager(tmp_path)
+    manager.create_project("Truncated")
+    metadata_path = tmp_path / "Truncated" / "project.msgpack"
+    metadata_path.write_bytes(metadata_path.read_bytes()[:-1])
 
     with pytest.raises(ProjectSerializationError):
-        manager.create_project("Invalid Metadata", metadata={"bad": object()})
+        manager.load_project("Truncated")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_create_many_projects(rng: random.Random, tmp_path: Path, count: int) -> None:
+    manager = ProjectManager(tmp_path)
+    for _ in range(count):
+        manager.create_project(f"Proj-{rng.randint(0, 1 << 30):x}")
+
+    assert len(list(manager.list_projects())) == count
@@ -1,41 +1,81 @@
-import unittest
+import copy
+import dataclasses
+import pickle
+from typing import Any, Dict, Tuple
+
+import pytest
 
 from modgen.prompt import PromptMessage, PromptValidationError, StructuredPrompt
 
 
-class StructuredPromptTests(unittest.TestCase):
-    def test_prompt_message_invalid_role(self) -> None:
-        with self.assertRaises(PromptValidationError):
-            PromptMessage(role="invalid", content="hello")
+@pytest.fixture(scope="module")
+def base_messages() -> Tuple[PromptMessage, PromptMessage]:
+    return (
+        PromptMessage(role="system", content="You are a test."),
+        PromptMessage(role="user", content="Say hello"),
+    )
+
+
+@pytest.fixture(scope="module")
+def payload(base_messages: Tuple[PromptMessage, PromptMessage]) -> Dict[str, Any]:
+    prompt = StructuredPrompt(
+        model="gpt-test",
+        messages=base_messages,
+        temperature=0.2,
+        max_tokens=10,
+        response_format={"type": "json_object"},
+        extra_parameters={"presence_penalty": 0.5},
+    )
+    return prompt.to_payload()
+
+
+def test_prompt_message_invalid_role() -> None:
+    with pytest.raises(PromptValidationError):
+        PromptMessage(role="invalid", content="hello")
 
-    def test_structured_prompt_payload(self) -> None:
-        prompt = StructuredPrompt(
-            model="gpt-test",
-            messages=[
-                PromptMessage(role="system", content="You are a test."),
-                PromptMessage(role="user", content="Say hello"),
-            ],
-            temperature=0.2,
-            max_tokens=10,
-            response_format={"type": "json_object"},
-            extra_parameters={"presence_penalty": 0.5},
-        )
 
-        payload = prompt.to_payload()
-        self.assertEqual(payload["model"], "gpt-test")
-        self.assertEqual(payload["temperature"], 0.2)
-        self.assertEqual(payload["max_tokens"], 10)
-        self.assertEqual(payload["response_format"], {"type": "json_object"})
-        self.assertEqual(payload["presence_penalty"], 0.5)
+def test_prompt_message_to_dict_returns_copy() -> None:
+    message = PromptMessage(role="user", content="hello", name="tester")
+    payload = message.to_dict()
+    payload["content"] = "changed"
+    assert message.to_dict() == {"role": "user", "content": "hello", "name": "tester"}
 
-    def test_structured_prompt_disallows_reserved_extra_parameters(self) -> None:
-        with self.assertRaises(PromptValidationError):
-            StructuredPrompt(
-                model="gpt-test",
-                messages=[PromptMessage(role="user", content="Hi")],
-                extra_parameters={"model": "override"},
-            )
 
+def test_prompt_message_dataclass_surface() -> None:
+    message = PromptMessage(role="user", content="hello", name="tester")
+    message.to_dict()
+    assert [f.name for f in dataclasses.fields(message)] == ["role", "content", "name"]
+    assert dataclasses.asdict(message) == {"role": "user", "content": "hello", "name": "tester"}
+    assert repr(message) == "PromptMessage(role='user', content='hello', name='tester')"
 
-if __name__ == "__main__":
-    unittest.main()
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda m: pickle.loads(pickle.dumps(m))])
+def test_prompt_message_clones_keep_payload(clone: Any) -> None:
+    message = PromptMessage(role="user", content="hello", name="tester")
+    message.to_dict()
+    cloned = clone(message)
+    assert cloned == message
+    assert cloned.to_dict() == message.to_dict()
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("model", "gpt-test"),
+        ("temperature", 0.2),
+        ("max_tokens", 10),
+        ("response_format", {"type": "json_object"}),
+        ("presence_penalty", 0.5),
+    ],
+)
+def test_structured_prompt_payload(payload: Dict[str, Any], key: str, expected: Any) -> None:
+    assert payload[key] == expected
+
+
+def test_structured_prompt_disallows_reserved_extra_parameters() -> None:
+    with pytest.raises(PromptValidationError):
+        StructuredPrompt(
+            model="gpt-test",
+            messages=[PromptMessage(role="user", content="Hi")],
+            extra_parameters={"model": "override"},
+        )
@@ -0,0 +1,46 @@
+import json
+import timeit
+
+import pytest
+
+from modgen import _serde
+
+
+def _chat_response(choices: int) -> bytes:
+    return json.dumps(
+        {
+            "id": "chatcmpl-123",
+            "model": "gpt-test",
+            "created": 1_700_000_000,
+            "choices": [
+                {
+                    "index": index,
+                    "message": {"role": "assistant", "content": "Hello there! " * 40},
+                    "finish_reason": "stop",
+                }
+                for index in range(choices)
+            ],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12},
+        }
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "document",
+    [b'{"big": 100000000000000000001}', b'[NaN, -Infinity]', b'"\\ud800"'],
+    ids=["wide-int", "non-finite", "lone-surrogate"],
+)
+def test_loads_matches_stdlib(document: bytes) -> None:
+    # repr() so that NaN compares equal to itself.
+    assert repr(_serde.loads(document)) == repr(json.loads(document))
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("choices", [10, 100])
+def test_loads_is_not_slower_than_stdlib(choices: int) -> None:
+    body = _chat_response(choices)
+
+    serde = min(timeit.repeat(lambda: _serde.loads(body), number=200, repeat=5))
+    stdlib = min(timeit.repeat(lambda: json.loads(body), number=200, repeat=5))
+
+    assert serde < stdlib * 1.5
@@ -1,8 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, List
 import textwrap
 
+import pytest
+
+from modgen import validation_engine
 from modgen.validation_engine import ValidationEngine
 
+_JAVA_VALID = textwrap.dedent(
+    """
+    public class Example {
+        public void run() {
+            System.out.println("hello");
+        }
+    }
+    """
+)
+
+_JAVA_INVALID = textwrap.dedent(
+    """
+    public class Example {
+        public void run() {
+            System.out.println("hello")
+        }
+    }
+    """
+)
+
+
+@pytest.fixture(params=["tree-sitter", "javalang"])
+def java_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[str]:
+    """Run a test against each Java parser backend in turn."""
+
+    if request.param == "tree-sitter":
+        if validation_engine._java_parser() is None:
+            pytest.skip("tree-sitter-java is not installed")
+    else:
+        monkeypatch.setattr(validation_engine, "_java_parser", lambda: None)
+    # Cached results are shared by all engines, whichever backend produced them.
+    ValidationEngine.clear_cache()
+    yield request.param
+    ValidationEngine.clear_cache()
+
 
 def test_validate_json_success() -> None:
     engine = ValidationEngine()
@@ -23,33 +65,60 @@ def test_validate_json_failure() -> None:
     assert issue.column is not None
 
 
-def test_validate_java_success() -> None:
+def test_validate_json_accepts_bytes() -> None:
     engine = ValidationEngine()
-    source = textwrap.dedent(
-        """
-        public class Example {
-            public void run() {
-                System.out.println("hello");
-            }
-        }
-        """
-    )
-    result = engine.validate_java(source, source_path=Path("Example.java"))
+    assert engine.validate_json('{"name": "Modgen \u2713"}'.encode("utf-8")).is_valid
+    result = engine.validate_json(b'{"name": "Modgen", }')
+    assert not result.is_valid
+    assert "JSON syntax error" in result.issues[0].message
+    assert (result.issues[0].line, result.issues[0].column) == (1, 20)
+
+
+def test_validate_json_byte_order_mark_follows_stdlib() -> None:
+    engine = ValidationEngine()
+    result = engine.validate_json("\ufeff{}")
+    assert not result.is_valid
+    assert "BOM" in result.issues[0].message
+    assert (result.issues[0].line, result.issues[0].column) == (1, 1)
+    assert engine.validate_json(b"\xef\xbb\xbf{}").is_valid
+
+
+def test_validate_json_reports_invalid_utf8() -> None:
+    result = ValidationEngine().validate_json(b'"\xff"', source_path=Path("bad.json"))
+    assert not result.is_valid
+    assert result.issues[0].message.startswith("JSON syntax error")
+    assert result.issues[0].path == Path("bad.json")
+
+
+def test_validate_json_reuses_cached_result_per_payload(monkeypatch) -> None:
+    ValidationEngine.clear_cache()
+    engine = ValidationEngine()
+    calls = []
+    parse_json = engine._parse_json
+
+    def counting_parse(payload):
+        calls.append(payload)
+        return parse_json(payload)
+
+    monkeypatch.setattr(engine, "_parse_json", counting_parse)
+
+    first = engine.validate_json("[1, 2,]", source_path=Path("dry-run.json"))
+    second = engine.validate_json("[1, 2,]", source_path=Path("apply.json"))
+
+    assert len(calls) == 1
+    assert first.issues[0].path == Path("dry-run.json")
+    assert second.issues[0].path == Path("apply.json")
+
+
+def test_validate_java_success(java_backend: str) -> None:
+    engine = ValidationEngine()
+    result = engine.validate_java(_JAVA_VALID, source_path=Path("Example.java"))
     assert result.is_valid
 
 
-def test_validate_java_failure() -> None:
+def test_validate_java_failure(java_backend: str) -> None:
     engine = ValidationEngine()
-    source = textwrap.dedent(
-        """
-        public class Example {
-            public void run() {
-                System.out.println("hello")
-            }
-        }
-        """
-    )
-    result = engine.validate_java(source, source_path=Path("Example.java"))
+    result = engine.validate_java(_JAVA_INVALID, source_path=Path("Example.java"))
     assert not result.is_valid
     issue = result.issues[0]
     assert issue.path == Path("Example.java")
@@ -57,19 +126,217 @@ def test_validate_java_failure() -> None:
     assert "Java" in issue.message
 
 
-def test_validate_file_structure_success(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    "source",
+    [
+        "x = 1;",
+        "int x;",
+        "class A { void f() { goto x; } }",
+        "class A { int const; }",
+        "class A {} import x.Y;",
+        "package a; package b;",
+    ],
+)
+def test_validate_java_rejects_invalid_compilation_units(
+    java_backend: str, source: str
+) -> None:
+    result = ValidationEngine().validate_java(source)
+    assert not result.is_valid
+    assert result.issues[0].message.startswith("Java syntax error")
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "; class A {} ;",
+        "// header\npackage a;\nimport b.C;\n@interface An {}\nenum E { X }\n",
+        'class A { int constant; String s = "goto"; }',
+    ],
+)
+def test_validate_java_accepts_compilation_units(java_backend: str, source: str) -> None:
+    assert ValidationEngine().validate_java(source).is_valid
+
+
+@pytest.mark.parametrize(
+    ("source", "modern"),
+    [
+        ("record R(int a) {}", True),
+        ("module m { requires java.base; }", True),
+        ("sealed interface S permits A {} final class A implements S {}", True),
+        (
+            "class A { int f(int x) { return switch (x) { case 1 -> 2; default -> 3; }; } }",
+            True,
+        ),
+        ('class A { String s = """\n    hi\n    """; }', True),
+        ("class A { void f(Object o) { if (o instanceof String s) {} } }", True),
+        ("class A { int x = 08; }", False),
+        ("class A { int x = 0x; }", False),
+    ],
+    ids=["record", "module", "sealed", "switch", "text-block", "pattern", "octal", "hex"],
+)
+def test_java_backends_validate_different_language_levels(
+    java_backend: str, source: str, modern: bool
+) -> None:
+    # tree-sitter validates modern Java; javalang is a Java 8 parser that
+    # does not check numeric literals.
+    expected = modern if java_backend == "tree-sitter" else not modern
+    assert ValidationEngine().validate_java(source).is_valid is expected
+
+
+def test_validate_java_accepts_lone_surrogates(java_backend: str) -> None:
+    engine = ValidationEngine()
+    assert engine.validate_java('class A { String s = "\ud800"; }').is_valid
+    result = engine.validate_java('class A { String s = "\ud800" }')
+    assert not result.is_valid
+
+
+def test_validate_java_reuses_cached_result_per_source(monkeypatch) -> None:
+    ValidationEngine.clear_cache()
+    engine = ValidationEngine()
+    calls = []
+    parse_java = engine._parse_java
+
+    def counting_parse(source):
+        calls.append(source)
+        return parse_java(source)
+
+    monkeypatch.setattr(engine, "_parse_java", counting_parse)
+    source = "class Cached { void run() { int x = 1 } }\n"
+
+    first = engine.validate_java(source, source_path=Path("First.java"))
+    second = engine.validate_java(source, source_path=Path("Second.java"))
+
+    assert len(calls) == 1
+    assert first.issues[0].path == Path("First.java")
+    assert second.issues[0].path == Path("Second.java")
+    assert first.issues[0].line == second.issues[0].line
+
+    ValidationEngine.clear_cache()
+    engine.validate_java(source)
+    assert len(calls) == 2
+
+
+def test_validate_java_batch() -> None:
+    engine = ValidationEngine()
+    sources = [
+        (Path("A.java"), "class A {}\n"),
+        (Path("B.java"), "class B { void run() { int x = 1 } }\n"),
+        (Path("C.java"), "class C {}\n"),
+    ]
+    results = engine.validate_java_batch(sources, max_workers=2)
+    assert set(results) == {Path("A.java"), Path("B.java"), Path("C.java")}
+    assert results[Path("A.java")].is_valid
+    assert results[Path("C.java")].is_valid
+    assert not results[Path("B.java")].is_valid
+    assert results[Path("B.java")].issues[0].path == Path("B.java")
+
+
+class _RecordingPool(ThreadPoolExecutor):
+    """Stands in for the process pool and records what it was asked to parse."""
+
+    submitted: List[str] = []
+
+    def map(self, fn, *iterables, **kwargs):  # type: ignore[override]
+        sources = list(iterables[0])
+        _RecordingPool.submitted.extend(sources)
+        return super().map(fn, sources)
+
+
+@pytest.fixture
+def recording_pool(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    _RecordingPool.submitted = []
+    monkeypatch.setattr(validation_engine, "ProcessPoolExecutor", _RecordingPool)
+    return _RecordingPool.submitted
+
+
+def test_validate_java_batch_uses_shared_cache(
+    java_backend: str, recording_pool: List[str]
+) -> None:
+    engine = ValidationEngine()
+    cached = "class A {}\n"
+    invalid = "class B { void run() { int x = 1 } }\n"
+    engine.validate_java(cached)
+    sources = [
+        (Path("A.java"), cached),
+        (Path("B.java"), invalid),
+        (Path("C.java"), "class C {}\n"),
+        (Path("D.java"), invalid),
+    ]
+
+    results = engine.validate_java_batch(sources, max_workers=2)
+
+    if java_backend == "tree-sitter":
+        assert recording_pool == []
+    else:
+        # Cache hits and duplicate sources are not sent to the workers.
+        assert recording_pool == [invalid, "class C {}\n"]
+    assert [path for path in results] == [path for path, _ in sources]
+    assert results[Path("D.java")].issues[0].path == Path("D.java")
+    assert results[Path("B.java")].issues[0].path == Path("B.java")
+
+    recording_pool.clear()
+    again = engine.validate_java_batch(sources, max_workers=2)
+    assert recording_pool == []
+    assert again == results
+
+
+def test_validate_java_batch_single_worker_runs_in_process(
+    java_backend: str, recording_pool: List[str]
+) -> None:
+    sources = [(Path(f"T{i}.java"), f"class T{i} {{}}\n") for i in range(4)]
+    results = ValidationEngine().validate_java_batch(sources, max_workers=1)
+    assert recording_pool == []
+    assert all(result.is_valid for result in results.values())
+
+
+def test_engine_can_be_shared_between_threads() -> None:
+    ValidationEngine.clear_cache()
+    engine = ValidationEngine()
+    sources = [f"class T{i} {{ int x = {i}{'' if i % 2 else ';'} }}\n" for i in range(16)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(engine.validate_java, sources))
+    assert [result.is_valid for result in results] == [i % 2 == 0 for i in range(16)]
+
+
+def test_validate_file_structure_success(java_src_tree: Path) -> None:
     engine = ValidationEngine()
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src" / "Example.java").write_text("class Example {}\n")
     expected = ["src/", "src/Example.java"]
-    result = engine.validate_file_structure(tmp_path, expected)
+    result = engine.validate_file_structure(java_src_tree, expected)
     assert result.is_valid
 
 
-def test_validate_file_structure_missing_file(tmp_path: Path) -> None:
+def test_validate_file_structure_missing_file(empty_src_tree: Path) -> None:
     engine = ValidationEngine()
-    (tmp_path / "src").mkdir()
-    result = engine.validate_file_structure(tmp_path, ["src/", "src/Main.java"])
+    result = engine.validate_file_structure(empty_src_tree, ["src/", "src/Main.java"])
     assert not result.is_valid
     issue_messages = [issue.message for issue in result.issues]
     assert any(message.startswith("Missing file") for message in issue_messages)
+
+
+def test_validate_file_structure_reports_kind_mismatch(tmp_path: Path) -> None:
+    engine = ValidationEngine()
+    (tmp_path / "src" / "main").mkdir(parents=True)
+    (tmp_path / "build.gradle").write_text("")
+    result = engine.validate_file_structure(
+        tmp_path, ["build.gradle/", "src/main", "src/main/", "src/../build.gradle"]
+    )
+    issue_messages = [issue.message for issue in result.issues]
+    assert len(issue_messages) == 2
+    assert issue_messages[0].startswith("Expected directory but found file")
+    assert issue_messages[1].startswith("Expected file but found directory")
+
+
+def test_validate_file_structure_follows_symlinks(tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real.txt").write_text("")
+    (tmp_path / "dir-link").symlink_to(tmp_path / "real")
+    (tmp_path / "file-link").symlink_to(tmp_path / "real.txt")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+
+    result = ValidationEngine().validate_file_structure(
+        tmp_path, ["dir-link/", "file-link", "dangling"]
+    )
+
+    assert [issue.message for issue in result.issues] == [
+        f"Missing file: {tmp_path / 'dangling'}"
+    ]